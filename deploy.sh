@@ -58,7 +58,7 @@ Type=simple
 User=ec2-user
 WorkingDirectory=/var/www/songs
 Environment=PATH=/var/www/songs/venv/bin
-ExecStart=/var/www/songs/venv/bin/uvicorn main:app --host 0.0.0.0 --port 8000
+ExecStart=/var/www/songs/venv/bin/python main.py
 Restart=always
 RestartSec=10
 
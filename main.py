@@ -1,75 +1,232 @@
 import sqlite3
 import logging
+import hashlib
+import multiprocessing
 import os
+import queue
+from functools import lru_cache
 from typing import List, Optional
-from datetime import datetime
 from pathlib import Path
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
-from fastapi import FastAPI, HTTPException, Depends
+from fastapi import FastAPI, HTTPException, Depends, Request, Response
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, HTMLResponse, ORJSONResponse
+from jinja2 import Template
 from pydantic import BaseModel
+import aiosqlite
+import orjson
+from aiosqlitepool import SQLiteConnectionPool
 import uvicorn
 
 # Set up logging
 log_dir = Path("log_archive")
 log_dir.mkdir(exist_ok=True)
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s:%(lineno)d - %(funcName)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(log_dir / "app.log"),
-        logging.StreamHandler()
-    ]
-)
+LOG_FORMAT = '%(asctime)s - %(name)s:%(lineno)d - %(funcName)s - %(levelname)s - %(message)s'
 
-# Configure rotating file handler
-from logging.handlers import RotatingFileHandler
-file_handler = RotatingFileHandler(
-    log_dir / "app.log",
-    maxBytes=1024*1024,  # 1MB
-    backupCount=3
-)
-file_handler.setFormatter(logging.Formatter(
-    '%(asctime)s - %(name)s:%(lineno)d - %(funcName)s - %(levelname)s - %(message)s'
-))
+def get_worker_count():
+    """Number of uvicorn workers python main.py will start"""
+    if os.getenv("DEV"):
+        return 1
+    return int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1))
+
+def should_log_to_file():
+    """Only a process that runs the app alone may own the rotating log file"""
+    # Uvicorn spawns workers with multiprocessing for both --workers N and
+    # --reload, however it was launched; siblings would clobber each other's rotation.
+    # A spawned python main.py worker first re-imports this file as __mp_main__,
+    # before parent_process() is set.
+    if __name__ == "__mp_main__" or multiprocessing.parent_process() is not None:
+        return False
+    # The supervisor of a multi-worker python main.py run serves no requests
+    if __name__ == "__main__" and get_worker_count() > 1:
+        return False
+    return True
 
+def setup_logging():
+    """Route all logging through a queue drained by one listener thread"""
+    root_logger = logging.getLogger()
+    
+    # Uvicorn workers import this file twice (as __mp_main__ and as main); reuse
+    # the first listener instead of attaching a second queue and doubling output
+    for handler in root_logger.handlers:
+        if isinstance(handler, QueueHandler) and hasattr(handler, "_croatoa_listener"):
+            return handler._croatoa_listener
+    
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    handlers = [stream_handler]
+    
+    # RotatingFileHandler cannot rotate a file shared by several processes, so
+    # multi-process runs log to stdout only (journald under systemd)
+    if should_log_to_file():
+        file_handler = RotatingFileHandler(
+            log_dir / "app.log",
+            maxBytes=50*1024*1024,  # 50MB
+            backupCount=10,
+            delay=True,  # Open the file on first write
+            encoding="utf-8"
+        )
+        file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        handlers.append(file_handler)
+    
+    # Request code only enqueues records; the listener thread does the actual writes
+    log_queue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    queue_handler._croatoa_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(queue_handler)
+    
+    queue_handler._croatoa_listener.start()
+    return queue_handler._croatoa_listener
+
+log_listener = setup_logging()
 logger = logging.getLogger(__name__)
-logger.addHandler(file_handler)
 
 # Initialize FastAPI app
-app = FastAPI(title="Song Lyrics Manager", version="1.0.0")
+app = FastAPI(title="Song Lyrics Manager", version="1.0.0", default_response_class=ORJSONResponse)
+app.add_middleware(GZipMiddleware, minimum_size=500)
+app.state.log_listener = log_listener
 
 # Database setup
 DATABASE_NAME = "songs.db"
 
-def get_db():
-    """Get database connection"""
-    conn = sqlite3.connect(DATABASE_NAME)
-    conn.row_factory = sqlite3.Row
+DB_POOL_SIZE = 5
+# Double sqlite3's default of 128 so the fixed route statements never get evicted
+DB_CACHED_STATEMENTS = 256
+
+# Bump when init_db gains new DDL; stored in the file as PRAGMA user_version
+SCHEMA_VERSION = 2
+
+# Rows come back as plain tuples; these name their fields in SELECT order
+SONG_FIELDS = ("id", "title", "lyrics", "created_at", "updated_at")
+SONG_SUMMARY_FIELDS = ("id", "title", "created_at", "updated_at")
+SONG_COLUMNS = ", ".join(SONG_FIELDS)
+
+# SQL is kept in constants so every request reuses the same prepared statement
+SQL_SONGS_VERSION = "SELECT rev FROM songs_meta WHERE id = 1"
+SQL_LIST_SONGS = f"SELECT {', '.join(SONG_SUMMARY_FIELDS)} FROM songs ORDER BY title"
+SQL_GET_SONG = f"SELECT {SONG_COLUMNS} FROM songs WHERE id = ?"
+SQL_INSERT_SONG = f"INSERT INTO songs (title, lyrics) VALUES (?, ?) RETURNING {SONG_COLUMNS}"
+SQL_INSERT_SONG_BATCH = "INSERT INTO songs (title, lyrics) VALUES (?, ?)"
+SQL_MAX_SONG_ID = "SELECT COALESCE(MAX(id), 0) FROM songs"
+SQL_SONGS_AFTER_ID = f"SELECT {SONG_COLUMNS} FROM songs WHERE id > ? ORDER BY id"
+# NULL leaves a field unchanged, so every partial update shares one statement
+SQL_UPDATE_SONG = (
+    "UPDATE songs SET title = COALESCE(?, title), lyrics = COALESCE(?, lyrics), "
+    f"updated_at = CURRENT_TIMESTAMP WHERE id = ? RETURNING {SONG_COLUMNS}"
+)
+SQL_DELETE_SONG = "DELETE FROM songs WHERE id = ? RETURNING id"
+
+async def connect_db():
+    """Open a new long-lived database connection for the pool"""
+    # Autocommit: each statement commits once its cursor is closed, no commit() round trip
+    conn = await aiosqlite.connect(
+        DATABASE_NAME, isolation_level=None, cached_statements=DB_CACHED_STATEMENTS
+    )
+    # journal_mode is persisted in the file by init_db; the rest are per-connection
+    await conn.execute("PRAGMA synchronous = NORMAL")
+    await conn.execute("PRAGMA mmap_size = 268435456")
+    await conn.execute("PRAGMA cache_size = -20000")
+    await conn.execute("PRAGMA temp_store = MEMORY")
+    await conn.execute("PRAGMA foreign_keys = ON")
     return conn
 
+async def get_conn():
+    """Borrow a pooled database connection for the duration of a request"""
+    async with app.state.pool.connection() as conn:
+        yield conn
+
+def get_schema_version(cursor):
+    """Read the schema version stamped into the database file"""
+    cursor.execute("PRAGMA user_version")
+    return cursor.fetchone()[0]
+
 def init_db():
-    """Initialize database with songs table"""
-    logger.info("Initializing database")
-    conn = get_db()
+    """Initialize database with songs table, skipping work once the schema is current"""
+    conn = sqlite3.connect(DATABASE_NAME, isolation_level=None)
     cursor = conn.cursor()
     
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS songs (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT NOT NULL UNIQUE,
-            lyrics TEXT NOT NULL DEFAULT '',
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
+    if get_schema_version(cursor) >= SCHEMA_VERSION:
+        conn.close()
+        return
+    
+    logger.info("Initializing database")
+    
+    # WAL is persisted in the file; it cannot be switched inside a transaction.
+    # Per-connection PRAGMAs are applied by connect_db.
+    cursor.execute("PRAGMA journal_mode = WAL")
+    
+    # Take the write lock so concurrently starting workers migrate only once
+    cursor.execute("BEGIN IMMEDIATE")
+    try:
+        if get_schema_version(cursor) < SCHEMA_VERSION:
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS songs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    title TEXT NOT NULL UNIQUE,
+                    lyrics TEXT NOT NULL DEFAULT '',
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            
+            # Covers the song list query so it is an ordered walk of the index alone
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS songs_title_cover
+                ON songs (title, id, created_at, updated_at)
+            ''')
+            
+            # Revision counter bumped by every write, shared by all workers; the
+            # song list ETag is derived from it instead of second-resolution timestamps
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS songs_meta (
+                    id INTEGER PRIMARY KEY CHECK (id = 1),
+                    rev INTEGER NOT NULL DEFAULT 0
+                )
+            ''')
+            cursor.execute("INSERT OR IGNORE INTO songs_meta (id, rev) VALUES (1, 0)")
+            for event in ("INSERT", "UPDATE", "DELETE"):
+                cursor.execute(f'''
+                    CREATE TRIGGER IF NOT EXISTS songs_bump_rev_{event.lower()}
+                    AFTER {event} ON songs
+                    BEGIN
+                        UPDATE songs_meta SET rev = rev + 1 WHERE id = 1;
+                    END
+                ''')
+            
+            cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        cursor.execute("COMMIT")
+    except Exception:
+        cursor.execute("ROLLBACK")
+        raise
+    finally:
+        conn.close()
     
-    conn.commit()
-    conn.close()
     logger.info("Database initialized successfully")
 
+# Share page template, compiled once at import; autoescape keeps song text inert
+SHARE_TEMPLATE = Template(Path("templates/share.html").read_text(), autoescape=True)
+SHARE_CACHE_CONTROL = "public, max-age=300, s-maxage=3600, stale-while-revalidate=86400"
+
+@lru_cache(maxsize=1024)
+def render_share_page(song_id, updated_at, title, lyrics, created_at):
+    """Render a share page once per song revision, returning the HTML bytes and their ETag"""
+    body = SHARE_TEMPLATE.render(
+        title=title,
+        lyrics=lyrics or "No lyrics available for this song.",
+        created_at=created_at,
+        updated_at=updated_at,
+    ).encode()
+    # Hash the body: updated_at only has one-second resolution and autosave edits faster
+    etag = f'W/"{song_id}-{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    return body, etag
+
+# Serialized song list, reused while the table is unchanged
+_songs_cache = {"tag": None, "body": None}
+
 # Pydantic models
 class SongCreate(BaseModel):
     title: str
@@ -79,6 +236,12 @@ class SongUpdate(BaseModel):
     title: Optional[str] = None
     lyrics: Optional[str] = None
 
+class SongSummary(BaseModel):
+    id: int
+    title: str
+    created_at: str
+    updated_at: str
+
 class Song(BaseModel):
     id: int
     title: str
@@ -87,140 +250,139 @@ class Song(BaseModel):
     updated_at: str
 
 # API Routes
-@app.get("/api/v1/songs", response_model=List[Song])
-def get_songs():
-    """Get all songs"""
-    logger.info("Fetching all songs")
-    conn = get_db()
-    cursor = conn.cursor()
+@app.get("/api/v1/songs", response_model=List[SongSummary])
+async def get_songs(request: Request, conn: aiosqlite.Connection = Depends(get_conn)):
+    """Get all songs, without lyrics"""
+    logger.debug("Fetching all songs")
+    
+    cursor = await conn.execute(SQL_SONGS_VERSION)
+    (rev,) = await cursor.fetchone()
+    tag = f'W/"{rev}"'
     
-    cursor.execute("SELECT * FROM songs ORDER BY title")
-    songs = cursor.fetchall()
-    conn.close()
+    # Revalidation needs only the revision, not this worker's cached body
+    headers = {"ETag": tag}
+    if request.headers.get("if-none-match") == tag:
+        return Response(status_code=304, headers=headers)
     
-    song_list = [dict(song) for song in songs]
-    logger.info(f"Retrieved {len(song_list)} songs")
-    return song_list
+    if tag != _songs_cache["tag"]:
+        cursor = await conn.execute(SQL_LIST_SONGS)
+        songs = await cursor.fetchall()
+        
+        song_list = [dict(zip(SONG_SUMMARY_FIELDS, song)) for song in songs]
+        _songs_cache["body"] = orjson.dumps(song_list)
+        _songs_cache["tag"] = tag
+        logger.debug("Retrieved %s songs", len(song_list))
+    
+    # Served as raw bytes, so the response_model only documents the schema
+    return Response(content=_songs_cache["body"], media_type="application/json", headers=headers)
 
 @app.get("/api/v1/songs/{song_id}", response_model=Song)
-def get_song(song_id: int):
+async def get_song(song_id: int, conn: aiosqlite.Connection = Depends(get_conn)):
     """Get a specific song by ID"""
-    logger.info(f"Fetching song with ID: {song_id}")
-    conn = get_db()
-    cursor = conn.cursor()
+    logger.debug("Fetching song with ID: %s", song_id)
     
-    cursor.execute("SELECT * FROM songs WHERE id = ?", (song_id,))
-    song = cursor.fetchone()
-    conn.close()
+    cursor = await conn.execute(SQL_GET_SONG, (song_id,))
+    song = await cursor.fetchone()
     
     if not song:
-        logger.warning(f"Song with ID {song_id} not found")
+        logger.warning("Song with ID %s not found", song_id)
         raise HTTPException(status_code=404, detail="Song not found")
     
-    return dict(song)
+    # Returning a Response skips response_model validation; the model stays for the schema
+    return ORJSONResponse(dict(zip(SONG_FIELDS, song)))
 
 @app.post("/api/v1/songs", response_model=Song)
-def create_song(song: SongCreate):
+async def create_song(song: SongCreate, conn: aiosqlite.Connection = Depends(get_conn)):
     """Create a new song"""
-    logger.info(f"Creating new song: {song.title}")
-    conn = get_db()
-    cursor = conn.cursor()
+    logger.info("Creating new song: %s", song.title)
     
     try:
-        cursor.execute(
-            "INSERT INTO songs (title, lyrics) VALUES (?, ?)",
-            (song.title, song.lyrics)
-        )
-        song_id = cursor.lastrowid
-        conn.commit()
+        async with conn.execute(SQL_INSERT_SONG, (song.title, song.lyrics)) as cursor:
+            created_song = await cursor.fetchone()
         
-        # Get the created song
-        cursor.execute("SELECT * FROM songs WHERE id = ?", (song_id,))
-        created_song = cursor.fetchone()
-        conn.close()
-        
-        logger.info(f"Successfully created song with ID: {song_id}")
-        return dict(created_song)
+        logger.info("Successfully created song with ID: %s", created_song[0])
+        return dict(zip(SONG_FIELDS, created_song))
     
     except sqlite3.IntegrityError:
-        conn.close()
-        logger.error(f"Song with title '{song.title}' already exists")
+        logger.error("Song with title '%s' already exists", song.title)
         raise HTTPException(status_code=400, detail="Song with this title already exists")
 
-@app.put("/api/v1/songs/{song_id}", response_model=Song)
-def update_song(song_id: int, song_update: SongUpdate):
-    """Update an existing song"""
-    logger.info(f"Updating song with ID: {song_id}")
-    conn = get_db()
-    cursor = conn.cursor()
+@app.post("/api/v1/songs/bulk", response_model=List[Song])
+async def create_songs_bulk(songs: List[SongCreate], conn: aiosqlite.Connection = Depends(get_conn)):
+    """Create several songs in a single transaction"""
+    logger.info("Creating %s songs in bulk", len(songs))
     
-    # Check if song exists
-    cursor.execute("SELECT * FROM songs WHERE id = ?", (song_id,))
-    existing_song = cursor.fetchone()
+    if not songs:
+        return []
     
-    if not existing_song:
-        conn.close()
-        logger.warning(f"Song with ID {song_id} not found for update")
-        raise HTTPException(status_code=404, detail="Song not found")
+    # One transaction means one WAL flush for the whole batch; IMMEDIATE takes
+    # the write lock up front so the new ids are exactly those above the old max
+    await conn.execute("BEGIN IMMEDIATE")
+    try:
+        cursor = await conn.execute(SQL_MAX_SONG_ID)
+        (last_id,) = await cursor.fetchone()
+        await conn.executemany(SQL_INSERT_SONG_BATCH, [(song.title, song.lyrics) for song in songs])
+        cursor = await conn.execute(SQL_SONGS_AFTER_ID, (last_id,))
+        created_songs = await cursor.fetchall()
+        await conn.execute("COMMIT")
     
-    # Update fields
-    update_fields = []
-    update_values = []
+    except sqlite3.IntegrityError:
+        await conn.execute("ROLLBACK")
+        logger.error("Bulk create rejected: a song title already exists")
+        raise HTTPException(status_code=400, detail="Song with this title already exists")
     
-    if song_update.title is not None:
-        update_fields.append("title = ?")
-        update_values.append(song_update.title)
+    except Exception:
+        await conn.execute("ROLLBACK")
+        raise
     
-    if song_update.lyrics is not None:
-        update_fields.append("lyrics = ?")
-        update_values.append(song_update.lyrics)
+    logger.info("Successfully created %s songs in bulk", len(created_songs))
+    return [dict(zip(SONG_FIELDS, song)) for song in created_songs]
+
+@app.put("/api/v1/songs/{song_id}", response_model=Song)
+async def update_song(song_id: int, song_update: SongUpdate, conn: aiosqlite.Connection = Depends(get_conn)):
+    """Update an existing song"""
+    logger.info("Updating song with ID: %s", song_id)
     
-    if update_fields:
-        update_fields.append("updated_at = CURRENT_TIMESTAMP")
-        update_values.append(song_id)
+    if song_update.title is None and song_update.lyrics is None:
+        cursor = await conn.execute(SQL_GET_SONG, (song_id,))
+        existing_song = await cursor.fetchone()
         
-        query = f"UPDATE songs SET {', '.join(update_fields)} WHERE id = ?"
-        
-        try:
-            cursor.execute(query, update_values)
-            conn.commit()
-            
-            # Get updated song
-            cursor.execute("SELECT * FROM songs WHERE id = ?", (song_id,))
-            updated_song = cursor.fetchone()
-            conn.close()
-            
-            logger.info(f"Successfully updated song with ID: {song_id}")
-            return dict(updated_song)
+        if not existing_song:
+            logger.warning("Song with ID %s not found for update", song_id)
+            raise HTTPException(status_code=404, detail="Song not found")
         
-        except sqlite3.IntegrityError:
-            conn.close()
-            logger.error(f"Song with title '{song_update.title}' already exists")
-            raise HTTPException(status_code=400, detail="Song with this title already exists")
+        return dict(zip(SONG_FIELDS, existing_song))
+    
+    try:
+        async with conn.execute(
+            SQL_UPDATE_SONG, (song_update.title, song_update.lyrics, song_id)
+        ) as cursor:
+            updated_song = await cursor.fetchone()
+    
+    except sqlite3.IntegrityError:
+        logger.error("Song with title '%s' already exists", song_update.title)
+        raise HTTPException(status_code=400, detail="Song with this title already exists")
     
-    conn.close()
-    return dict(existing_song)
+    if not updated_song:
+        logger.warning("Song with ID %s not found for update", song_id)
+        raise HTTPException(status_code=404, detail="Song not found")
+    
+    logger.info("Successfully updated song with ID: %s", song_id)
+    return dict(zip(SONG_FIELDS, updated_song))
 
 @app.delete("/api/v1/songs/{song_id}")
-def delete_song(song_id: int):
+async def delete_song(song_id: int, conn: aiosqlite.Connection = Depends(get_conn)):
     """Delete a song"""
-    logger.info(f"Deleting song with ID: {song_id}")
-    conn = get_db()
-    cursor = conn.cursor()
+    logger.info("Deleting song with ID: %s", song_id)
     
-    cursor.execute("SELECT * FROM songs WHERE id = ?", (song_id,))
-    song = cursor.fetchone()
+    async with conn.execute(SQL_DELETE_SONG, (song_id,)) as cursor:
+        song = await cursor.fetchone()
     
     if not song:
-        conn.close()
-        logger.warning(f"Song with ID {song_id} not found for deletion")
+        logger.warning("Song with ID %s not found for deletion", song_id)
         raise HTTPException(status_code=404, detail="Song not found")
     
-    cursor.execute("DELETE FROM songs WHERE id = ?", (song_id,))
-    conn.commit()
-    conn.close()
-    
-    logger.info(f"Successfully deleted song with ID: {song_id}")
+    logger.info("Successfully deleted song with ID: %s", song_id)
     return {"message": "Song deleted successfully"}
 
 # Serve static files
@@ -232,161 +394,48 @@ def read_root():
     return FileResponse("static/index.html")
 
 @app.get("/share/{song_id}")
-def share_song(song_id: int):
+async def share_song(song_id: int, request: Request, conn: aiosqlite.Connection = Depends(get_conn)):
     """Serve a shared song page"""
-    logger.info(f"Serving shared song with ID: {song_id}")
-    conn = get_db()
-    cursor = conn.cursor()
+    logger.debug("Serving shared song with ID: %s", song_id)
     
-    cursor.execute("SELECT * FROM songs WHERE id = ?", (song_id,))
-    song = cursor.fetchone()
-    conn.close()
+    cursor = await conn.execute(SQL_GET_SONG, (song_id,))
+    song = await cursor.fetchone()
     
     if not song:
-        logger.warning(f"Song with ID {song_id} not found for sharing")
+        logger.warning("Song with ID %s not found for sharing", song_id)
         raise HTTPException(status_code=404, detail="Song not found")
     
-    song_dict = dict(song)
-    
-    # Create HTML content for the shared song
-    html_content = f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{song_dict['title']} - CROATOA</title>
-    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/tailwindcss/2.2.19/tailwind.min.css">
-    <link rel="preconnect" href="https://fonts.googleapis.com">
-    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800;900&family=JetBrains+Mono:wght@300;400;500;600;700&display=swap" rel="stylesheet">
-    <style>
-        :root {{
-            --bg-primary: #0a0a0a;
-            --bg-secondary: #1a1a1a;
-            --bg-tertiary: #2a2a2a;
-            --text-primary: #ffffff;
-            --text-secondary: #a0a0a0;
-            --text-accent: #00ff88;
-            --border-color: #333;
-            --glass-bg: rgba(255, 255, 255, 0.05);
-            --glass-border: rgba(255, 255, 255, 0.1);
-        }}
-        
-        * {{
-            font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif;
-        }}
-        
-        body {{
-            background: var(--bg-primary);
-            background-image: 
-                radial-gradient(circle at 20% 80%, rgba(0, 255, 136, 0.1) 0%, transparent 50%),
-                radial-gradient(circle at 80% 20%, rgba(255, 0, 136, 0.1) 0%, transparent 50%),
-                radial-gradient(circle at 40% 40%, rgba(0, 136, 255, 0.1) 0%, transparent 50%);
-            min-height: 100vh;
-            color: var(--text-primary);
-            overflow-x: hidden;
-        }}
-        
-        .glass-card {{
-            background: var(--glass-bg);
-            backdrop-filter: blur(10px);
-            border: 1px solid var(--glass-border);
-            border-radius: 16px;
-            box-shadow: 0 8px 32px rgba(0, 0, 0, 0.3);
-        }}
-        
-        .neon-text {{
-            color: var(--text-accent);
-            text-shadow: 0 0 10px rgba(0, 255, 136, 0.5);
-        }}
-        
-        .lyrics-display {{
-            background: rgba(0, 0, 0, 0.3);
-            border: 1px solid rgba(255, 255, 255, 0.1);
-            border-radius: 12px;
-            padding: 24px;
-            color: var(--text-primary);
-            font-family: 'JetBrains Mono', monospace;
-            font-size: 14px;
-            line-height: 1.6;
-            white-space: pre-wrap;
-            max-height: 70vh;
-            overflow-y: auto;
-        }}
-        
-        .header-logo {{
-            background: linear-gradient(45deg, #00ff88, #00cc6a);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-            font-weight: 900;
-            font-size: 2.5rem;
-            letter-spacing: -0.05em;
-            text-align: center;
-            margin-bottom: 2rem;
-        }}
-        
-        .btn-secondary {{
-            background: rgba(255, 255, 255, 0.1);
-            color: var(--text-primary);
-            border: 1px solid rgba(255, 255, 255, 0.2);
-            padding: 8px 16px;
-            border-radius: 8px;
-            font-weight: 500;
-            cursor: pointer;
-            transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-            text-decoration: none;
-            display: inline-flex;
-            align-items: center;
-        }}
-        
-        .btn-secondary:hover {{
-            background: rgba(0, 255, 136, 0.1);
-            border-color: var(--text-accent);
-            transform: translateY(-2px);
-        }}
-    </style>
-</head>
-<body>
-    <div class="container mx-auto p-8 max-w-4xl">
-        <div class="text-center mb-8">
-            <h1 class="header-logo">CROATOA</h1>
-            <a href="/" class="btn-secondary">
-                <svg class="w-4 h-4 mr-2" fill="currentColor" viewBox="0 0 20 20">
-                    <path fill-rule="evenodd" d="M9.707 16.707a1 1 0 01-1.414 0l-6-6a1 1 0 010-1.414l6-6a1 1 0 011.414 1.414L5.414 9H17a1 1 0 110 2H5.414l4.293 4.293a1 1 0 010 1.414z" clip-rule="evenodd"/>
-                </svg>
-                Back to Song Manager
-            </a>
-        </div>
-        
-        <div class="glass-card p-8">
-            <div class="text-center mb-8">
-                <h2 class="text-3xl font-bold neon-text mb-2">{song_dict['title']}</h2>
-                <p class="text-gray-400">by CROATOA</p>
-            </div>
-            
-            <div class="lyrics-display">
-{song_dict['lyrics'] if song_dict['lyrics'] else 'No lyrics available for this song.'}
-            </div>
-            
-            <div class="text-center mt-6 text-sm text-gray-500">
-                <p>Created: {song_dict['created_at']}</p>
-                {f"<p>Last updated: {song_dict['updated_at']}</p>" if song_dict['updated_at'] != song_dict['created_at'] else ""}
-            </div>
-        </div>
-    </div>
-</body>
-</html>
-    """
-    
-    from fastapi.responses import HTMLResponse
-    return HTMLResponse(content=html_content)
-
-# Initialize database on startup
+    _, title, lyrics, created_at, updated_at = song
+    html_content, etag = render_share_page(song_id, updated_at, title, lyrics, created_at)
+    
+    headers = {"ETag": etag, "Cache-Control": SHARE_CACHE_CONTROL}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    
+    return HTMLResponse(content=html_content, headers=headers)
+
+# Initialize database and connection pool on startup
 @app.on_event("startup")
-def startup_event():
+async def startup_event():
     init_db()
+    app.state.pool = SQLiteConnectionPool(connect_db, pool_size=DB_POOL_SIZE)
+
+# Close pooled connections and flush queued log records on shutdown
+@app.on_event("shutdown")
+async def shutdown_event():
+    await app.state.pool.close()
+    app.state.log_listener.stop()
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000, reload=True)
+    server_kwargs = {
+        "host": "0.0.0.0",
+        "port": 8000,
+        "workers": get_worker_count(),
+        "loop": "uvloop",
+        "http": "httptools",
+        "log_level": "warning",
+    }
+    # Single reloading worker for local development
+    if os.getenv("DEV"):
+        server_kwargs["reload"] = True
+    uvicorn.run("main:app", **server_kwargs)
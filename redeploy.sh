@@ -36,6 +36,30 @@ cd /var/www/songs
 tar -xzf /tmp/songs-app.tar.gz
 rm /tmp/songs-app.tar.gz
 
+# Install any new or updated dependencies
+source venv/bin/activate
+pip install -r requirements.txt
+
+# Refresh the systemd service so existing servers pick up launcher changes
+sudo tee /etc/systemd/system/songs.service > /dev/null << 'SERVICE_EOF'
+[Unit]
+Description=Songs FastAPI Application
+After=network.target
+
+[Service]
+Type=simple
+User=ec2-user
+WorkingDirectory=/var/www/songs
+Environment=PATH=/var/www/songs/venv/bin
+ExecStart=/var/www/songs/venv/bin/python main.py
+Restart=always
+RestartSec=10
+
+[Install]
+WantedBy=multi-user.target
+SERVICE_EOF
+sudo systemctl daemon-reload
+
 # Restart the application
 sudo systemctl start songs
 sudo systemctl restart nginx